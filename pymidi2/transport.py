@@ -14,14 +14,18 @@ from urllib.parse import urlparse
 from zeroconf import ServiceBrowser, ServiceListener, Zeroconf
 
 from . import udp
-from .ump import UMP, MessageType
+from .ump import UMP, UMP_NUM_WORDS, encode_many
 
 logger = getLogger(__name__)
 
 
-def encode_ump(packet: UMP, struct_ordering: str) -> bytes:
+# Network MIDI 2.0 carries UMP words in big endian; packets are 1 to 4 words long
+_NETWORK_UMP_STRUCTS = tuple(struct.Struct(f">{n}I") for n in range(5))
+
+
+def _encode_network_ump(packet: UMP) -> bytes:
     words = packet.encode()
-    return struct.pack(struct_ordering + len(words) * "I", *words)
+    return _NETWORK_UMP_STRUCTS[len(words)].pack(*words)
 
 
 class Transport:
@@ -111,15 +115,15 @@ class ALSATransport(Transport):
         self.recvfd.close()
 
     def sendmany(self, packets: list[UMP]):
+        words = encode_many(packets)
         with self.location.open("wb") as fd:
-            fd.write(b"".join(encode_ump(p, "@") for p in packets))
+            fd.write(struct.pack(f"@{len(words)}I", *words))
         for p in packets:
             logger.debug(f"Tx {p!r}")
 
     def recv(self) -> UMP:
         words = struct.unpack("@I", self.recvfd.read(4))
-        mt = MessageType(words[0] >> 28)
-        remaining = mt.num_words - 1
+        remaining = UMP_NUM_WORDS[words[0] >> 28] - 1
         if remaining:
             words += struct.unpack(
                 "@" + "I" * remaining,
@@ -306,7 +310,7 @@ class UDPTransport(Transport):
                 udp.CommandPacket(
                     command=udp.CommandCode.UMP_DATA,
                     specific_data=self.tx_seq + i,
-                    payload=encode_ump(p, ">"),
+                    payload=_encode_network_ump(p),
                 )
                 for i, p in enumerate(packets)
             ],
@@ -320,10 +324,7 @@ class UDPTransport(Transport):
                 self.sendcmd(reply)
 
             case udp.CommandCode.UMP_DATA:
-                words = [
-                    int.from_bytes(cmd.payload[4 * i : 4 * (i + 1)], byteorder="big")
-                    for i in range(len(cmd.payload) // 4)
-                ]
+                words = struct.unpack(f">{len(cmd.payload) // 4}I", cmd.payload)
                 self.rx_queue.append(UMP.parse(words))
 
     def recv(self) -> UMP:
@@ -1,5 +1,9 @@
-from dataclasses import dataclass, field
+import struct
+from collections.abc import Iterable, Mapping, Sequence
+from dataclasses import dataclass
 from enum import IntEnum, IntFlag
+from types import MappingProxyType
+from typing import ClassVar
 
 
 class MessageType(IntEnum):
@@ -19,16 +23,9 @@ class MessageType(IntEnum):
         return UMP_NUM_WORDS[self]
 
 
-UMP_NUM_WORDS = {
-    MessageType.UTILITY: 1,
-    MessageType.SYSTEM_REAL_TIME: 1,
-    MessageType.MIDI_1_CHANNEL_VOICE: 1,
-    MessageType.DATA_64: 2,
-    MessageType.MIDI_2_CHANNEL_VOICE: 2,
-    MessageType.DATA_128: 4,
-    MessageType.FLEX_DATA: 4,
-    MessageType.UMP_STREAM: 4,
-}
+# Packet size in words, indexed by the raw message type. The reserved message
+# types have a defined size too, so that they can be skipped in a word stream
+UMP_NUM_WORDS = (1, 1, 1, 2, 2, 4, 1, 1, 2, 2, 2, 3, 3, 4, 4, 4)
 
 
 class StreamFormat(IntEnum):
@@ -39,21 +36,46 @@ class StreamFormat(IntEnum):
 
     @property
     def is_starting(self):
-        return self in {self.COMPLETE, self.START}
+        # COMPLETE (0b00) and START (0b01) are the only values with bit 1 clear
+        return not self & 0b10
 
     @property
     def is_ending(self):
-        return self in {self.COMPLETE, self.END}
+        # COMPLETE (0b00) and END (0b11) are the only values with equal bits
+        return not (self ^ (self >> 1)) & 0b01
+
+
+# Every 2-bit value is a valid format, so index this instead of calling the enum
+_STREAM_FORMATS = tuple(StreamFormat)
+
 
+# Indexed by a single extracted bit, cheaper than calling bool()
+_BOOL = (False, True)
 
-@dataclass
+
+# Messages are slotted dataclasses: @dataclass(slots=True) creates a new class,
+# which breaks zero-argument super(), so overrides call their parent explicitly
+@dataclass(slots=True)
 class UMP:
-    mt: MessageType = field(init=False)
+    mt: ClassVar[MessageType]
+    # Constant bits of the first word, precomputed for each concrete message class
+    _header: ClassVar[int]
+    # Families with a class-level status set where it sits in the first word
+    _status_attr: ClassVar[str] = "status"
+    _status_shift: ClassVar[int | None] = None
+
+    def __init_subclass__(cls) -> None:
+        # Only concrete messages define their status, skip families and the like
+        status = getattr(cls, cls._status_attr, None)
+        if cls._status_shift is not None and isinstance(status, int):
+            cls._header = (cls.mt << 28) | (status << cls._status_shift)
 
     @classmethod
     def parse(cls, words):
-        mt = MessageType(words[0] >> 28)
-        return UMP_BY_MT[mt].parse(words)
+        key = ((words[0] >> 24) & 0xF0) | ((words[0] >> 20) & 0xF)
+        if (impl := _UMP_BY_MT_NIBBLE[key]) is None:
+            raise ValueError(f"Unsupported UMP message type {words[0] >> 28:#x}")
+        return impl.parse(words)
 
     def encode_into(self, words: list[int]) -> None:
         words[0] |= self.mt << 28
@@ -64,8 +86,29 @@ class UMP:
         return words
 
 
+def encode_many(packets: Iterable[UMP]) -> list[int]:
+    """Encode a sequence of UMP packets into a single flat list of words"""
+    words: list[int] = []
+    for packet in packets:
+        words += packet.encode()
+    return words
+
+
+def parse_many(words: Sequence[int]) -> list[UMP]:
+    """Parse a flat sequence of words holding consecutive UMP packets"""
+    packets = []
+    offset = 0
+    while offset < len(words):
+        end = offset + UMP_NUM_WORDS[words[offset] >> 28]
+        if end > len(words):
+            raise ValueError("Truncated UMP packet at the end of the words")
+        packets.append(UMP.parse(words[offset:end]))
+        offset = end
+    return packets
+
+
 # Utility Messages
-@dataclass
+@dataclass(slots=True)
 class Utility(UMP):
     class Status(IntEnum):
         NOOP = 0x0
@@ -74,68 +117,62 @@ class Utility(UMP):
         DELTA_CLOCKSTAMP_TPQ = 0x3
         DELTA_CLOCKSTAMP = 0x4
 
-    status: Status = field(init=False)
-
-    def __post_init__(self):
-        self.mt = MessageType.UTILITY
+    mt = MessageType.UTILITY
+    status: ClassVar[Status]
+    _status_shift = 20
 
     @classmethod
-    def parse(cls, words, **kwargs):
-        status = cls.Status((words[0] >> 20) & 0xF)
-        return UTILITY_BY_STATUS[status].parse(words, **kwargs)
+    def parse(cls, words):
+        status = (words[0] >> 20) & 0xF
+        if (impl := _UTILITY_BY_STATUS[status]) is None:
+            raise ValueError(f"Unsupported Utility message status {status:#x}")
+        return impl.parse(words)
 
     def encode_into(self, words: list[int]) -> None:
-        super().encode_into(words)
-        words[0] |= self.status << 20
+        words[0] |= self._header
 
 
-@dataclass
+@dataclass(slots=True)
 class NoOp(Utility):
-    def __post_init__(self):
-        super().__post_init__()
-        self.status = Utility.Status.NOOP
+    status = Utility.Status.NOOP
 
     @classmethod
-    def parse(cls, words, **kwargs):
-        return cls(**kwargs)
+    def parse(cls, words):
+        return cls()
 
 
-@dataclass
+@dataclass(slots=True)
 class JRClock(Utility):
-    timestamp: int
+    status = Utility.Status.JR_CLOCK
 
-    def __post_init__(self):
-        super().__post_init__()
-        self.status = Utility.Status.JR_CLOCK
+    timestamp: int
 
     @classmethod
-    def parse(cls, words, **kwargs):
-        return cls(timestamp=words[0] & 0xFFFFF, **kwargs)
+    def parse(cls, words):
+        return cls(timestamp=words[0] & 0xFFFFF)
 
     def encode_into(self, words: list[int]) -> None:
-        super().encode_into(words)
+        Utility.encode_into(self, words)
         words[0] |= self.timestamp & 0xFFFFF
 
 
-@dataclass
+@dataclass(slots=True)
 class JRTimestamp(Utility):
-    timestamp: int
+    status = Utility.Status.JR_TIMESTAMP
 
-    def __post_init__(self):
-        super().__post_init__()
-        self.status = Utility.Status.JR_TIMESTAMP
+    timestamp: int
 
     @classmethod
-    def parse(cls, words, **kwargs):
-        return cls(timestamp=words[0] & 0xFFFFF, **kwargs)
+    def parse(cls, words):
+        return cls(timestamp=words[0] & 0xFFFFF)
 
     def encode_into(self, words: list[int]) -> None:
-        super().encode_into(words)
+        Utility.encode_into(self, words)
         words[0] |= self.timestamp & 0xFFFFF
 
 
 # System Real Time Messages
-@dataclass
+@dataclass(slots=True)
 class SystemRealTime(UMP):
     class Status(IntEnum):
         MIDI_TIME_CODE = 0x1
@@ -149,22 +186,22 @@ class SystemRealTime(UMP):
         ACTIVE_SENSING = 0xE
         RESET = 0xF
 
-    status: Status = field(init=False)
-
-    def __post_init__(self):
-        self.mt = MessageType.SYSTEM_REAL_TIME
+    mt = MessageType.SYSTEM_REAL_TIME
+    status: ClassVar[Status]
+    _status_shift = 16
 
     @classmethod
-    def parse(cls, words, **kwargs):
-        status = SystemRealTime.Status((words[0] >> 16) & 0xFF)
-        return SYSTEM_RT_BY_STATUS.get(status, cls).parse(words, **kwargs)
+    def parse(cls, words):
+        status = (words[0] >> 16) & 0xFF
+        if (impl := _SYSTEM_RT_BY_STATUS[status]) is None:
+            raise ValueError(f"Unsupported System Real Time status {status:#x}")
+        return impl.parse(words)
 
     def encode_into(self, words: list[int]) -> None:
-        super().encode_into(words)
-        words[0] |= self.status << 16
+        words[0] |= self._header
 
 
-@dataclass
+@dataclass(slots=True)
 class MIDITimeCode(SystemRealTime):
     class TimeUnit(IntEnum):
         FRAME_LOW_NIBBLE = 0
@@ -176,48 +213,42 @@ class MIDITimeCode(SystemRealTime):
         HOURS_LOW_NIBBLE = 6
         RATE_AND_HOURS_HIGH_NIBBLE = 7
 
+    status = SystemRealTime.Status.MIDI_TIME_CODE
+
     type: TimeUnit
     value: int
 
-    def __post_init__(self):
-        super().__post_init__()
-        self.status = SystemRealTime.Status.MIDI_TIME_CODE
-
     @classmethod
-    def parse(cls, words, **kwargs):
+    def parse(cls, words):
         return cls(
             type=cls.TimeUnit((words[0] >> 12) & 0x07),
             value=(words[0] >> 8) & 0x0F,
-            **kwargs,
         )
 
     def encode_into(self, words: list[int]) -> None:
-        super().encode_into(words)
+        SystemRealTime.encode_into(self, words)
         words[0] |= (self.type << 12) | (self.value << 8)
 
 
-@dataclass
+@dataclass(slots=True)
 class SongPositionPointer(SystemRealTime):
-    position: int
+    status = SystemRealTime.Status.SONG_POSITION_POINTER
 
-    def __post_init__(self):
-        super().__post_init__()
-        self.status = SystemRealTime.Status.SONG_POSITION_POINTER
+    position: int
 
     @classmethod
-    def parse(cls, words, **kwargs):
+    def parse(cls, words):
         return cls(
             position=((words[0] & 0x7F) << 7) | ((words[0] >> 8) & 0x7F),
-            **kwargs,
         )
 
     def encode_into(self, words: list[int]) -> None:
-        super().encode_into(words)
+        SystemRealTime.encode_into(self, words)
         words[0] |= ((self.position & 0x7F) << 8) | ((self.position >> 7) & 0x7F)
 
 
 # MIDI 1.0 Channel Voice Messages
-@dataclass
+@dataclass(slots=True)
 class MIDI1ChannelVoice(UMP):
     class Status(IntEnum):
         NOTE_OFF = 0x8
@@ -228,129 +259,132 @@ class MIDI1ChannelVoice(UMP):
         CHANNEL_PRESSURE = 0xD
         PITCH_BEND = 0xE
 
+    mt = MessageType.MIDI_1_CHANNEL_VOICE
+    status: ClassVar[Status]
+    _status_shift = 20
+
     group: int
-    status: Status = field(init=False)
     channel: int
 
-    def __post_init__(self):
-        self.mt = MessageType.MIDI_1_CHANNEL_VOICE
-
     @property
     def midi1(self) -> bytes:
         """Return the message contained in this UMP in MIDI1 format"""
         raise NotImplementedError()
 
     @classmethod
-    def parse(cls, words, **kwargs):
-        group = (words[0] >> 24) & 0xF
-        status = cls.Status((words[0] >> 20) & 0xF)
-        channel = (words[0] >> 16) & 0xF
-        return MIDI1_BY_STATUS[status].parse(
-            words,
-            group=group,
-            channel=channel,
-            **kwargs,
-        )
+    def parse(cls, words):
+        status = (words[0] >> 20) & 0xF
+        if (impl := _MIDI1_BY_STATUS[status]) is None:
+            raise ValueError(f"Unsupported MIDI 1.0 Channel Voice status {status:#x}")
+        return impl.parse(words)
 
     def encode_into(self, words: list[int]) -> None:
-        super().encode_into(words)
-        words[0] |= (self.group << 24) | (self.status << 20) | (self.channel << 16)
+        words[0] |= self._header | (self.group << 24) | (self.channel << 16)
 
 
-@dataclass
+@dataclass(slots=True)
 class MIDI1NoteOff(MIDI1ChannelVoice):
+    status = MIDI1ChannelVoice.Status.NOTE_OFF
+
     note: int
     velocity: int
 
-    def __post_init__(self):
-        super().__post_init__()
-        self.status = MIDI1ChannelVoice.Status.NOTE_OFF
-
     @property
     def midi1(self) -> bytes:
         return bytes([(self.status << 4) | self.channel, self.note, self.velocity])
 
     @classmethod
-    def parse(cls, words, **kwargs):
-        return cls(note=(words[0] >> 8) & 0x7F, velocity=words[0] & 0x7F, **kwargs)
+    def parse(cls, words):
+        return cls(
+            group=(words[0] >> 24) & 0xF,
+            channel=(words[0] >> 16) & 0xF,
+            note=(words[0] >> 8) & 0x7F,
+            velocity=words[0] & 0x7F,
+        )
 
     def encode_into(self, words: list[int]) -> None:
-        super().encode_into(words)
+        MIDI1ChannelVoice.encode_into(self, words)
         words[0] |= (self.note << 8) | self.velocity
 
 
-@dataclass
+@dataclass(slots=True)
 class MIDI1NoteOn(MIDI1ChannelVoice):
+    status = MIDI1ChannelVoice.Status.NOTE_ON
+
     note: int
     velocity: int
 
-    def __post_init__(self):
-        super().__post_init__()
-        self.status = MIDI1ChannelVoice.Status.NOTE_ON
-
     @property
     def midi1(self) -> bytes:
         return bytes([(self.status << 4) | self.channel, self.note, self.velocity])
 
     @classmethod
-    def parse(cls, words, **kwargs):
-        return cls(note=(words[0] >> 8) & 0x7F, velocity=words[0] & 0x7F, **kwargs)
+    def parse(cls, words):
+        return cls(
+            group=(words[0] >> 24) & 0xF,
+            channel=(words[0] >> 16) & 0xF,
+            note=(words[0] >> 8) & 0x7F,
+            velocity=words[0] & 0x7F,
+        )
 
     def encode_into(self, words: list[int]) -> None:
-        super().encode_into(words)
+        MIDI1ChannelVoice.encode_into(self, words)
         words[0] |= (self.note << 8) | self.velocity
 
 
-@dataclass
+@dataclass(slots=True)
 class MIDI1ControlChange(MIDI1ChannelVoice):
+    status = MIDI1ChannelVoice.Status.CONTROL_CHANGE
+
     controller: int
     value: int
 
-    def __post_init__(self):
-        super().__post_init__()
-        self.status = MIDI1ChannelVoice.Status.CONTROL_CHANGE
-
     @property
     def midi1(self) -> bytes:
         return bytes([(self.status << 4) | self.channel, self.controller, self.value])
 
     @classmethod
-    def parse(cls, words, **kwargs):
-        return cls(controller=(words[0] >> 8) & 0x7F, value=words[0] & 0x7F, **kwargs)
+    def parse(cls, words):
+        return cls(
+            group=(words[0] >> 24) & 0xF,
+            channel=(words[0] >> 16) & 0xF,
+            controller=(words[0] >> 8) & 0x7F,
+            value=words[0] & 0x7F,
+        )
 
     def encode_into(self, words: list[int]) -> None:
-        super().encode_into(words)
+        MIDI1ChannelVoice.encode_into(self, words)
         words[0] |= (self.controller << 8) | self.value
 
 
-@dataclass
+@dataclass(slots=True)
 class MIDI1ProgramChange(MIDI1ChannelVoice):
-    program: int
+    status = MIDI1ChannelVoice.Status.PROGRAM_CHANGE
 
-    def __post_init__(self):
-        super().__post_init__()
-        self.status = MIDI1ChannelVoice.Status.PROGRAM_CHANGE
+    program: int
 
     @property
     def midi1(self) -> bytes:
         return bytes([(self.status << 4) | self.channel, self.program])
 
     @classmethod
-    def parse(cls, words, **kwargs):
-        return cls(program=words[0] & 0x7F, **kwargs)
+    def parse(cls, words):
+        return cls(
+            group=(words[0] >> 24) & 0xF,
+            channel=(words[0] >> 16) & 0xF,
+            program=words[0] & 0x7F,
+        )
 
     def encode_into(self, words: list[int]) -> None:
-        super().encode_into(words)
+        MIDI1ChannelVoice.encode_into(self, words)
         words[0] |= self.program
 
 
-@dataclass
+@dataclass(slots=True)
 class MIDI1PitchBend(MIDI1ChannelVoice):
-    value: int
+    status = MIDI1ChannelVoice.Status.PITCH_BEND
 
-    def __post_init__(self):
-        super().__post_init__()
-        self.status = MIDI1ChannelVoice.Status.PITCH_BEND
+    value: int
 
     @property
     def midi1(self) -> bytes:
@@ -359,21 +393,24 @@ class MIDI1PitchBend(MIDI1ChannelVoice):
         return bytes([(self.status << 4) | self.channel, lsb, msb])
 
     @classmethod
-    def parse(cls, words, **kwargs):
+    def parse(cls, words):
         lsb = (words[0] >> 8) & 0x7F
         msb = words[0] & 0x7F
-        value = (msb << 7) | lsb
-        if value & (1 << 13):
-            value -= 1 << 14
-        return cls(value=value, **kwargs)
+        # Sign-extend the 14-bit value: (x ^ (1 << 13)) - (1 << 13)
+        value = (((msb << 7) | lsb) ^ 0x2000) - 0x2000
+        return cls(
+            group=(words[0] >> 24) & 0xF,
+            channel=(words[0] >> 16) & 0xF,
+            value=value,
+        )
 
     def encode_into(self, words: list[int]) -> None:
-        super().encode_into(words)
+        MIDI1ChannelVoice.encode_into(self, words)
         words[0] |= ((self.value & 0x7F) << 8) | ((self.value >> 7) & 0x7F)
 
 
 # MIDI 2.0 Channel Voice Messages
-@dataclass
+@dataclass(slots=True)
 class MIDI2ChannelVoice(UMP):
     class Status(IntEnum):
         REGISTERED_PER_NOTE_CONTROLLER = 0x0
@@ -392,283 +429,258 @@ class MIDI2ChannelVoice(UMP):
         PITCH_BEND = 0xE
         PER_NOTE_MANAGEMENT = 0xF
 
+    mt = MessageType.MIDI_2_CHANNEL_VOICE
+    status: ClassVar[Status]
+    _status_shift = 20
+
     group: int
-    status: Status = field(init=False)
     channel: int
 
-    def __post_init__(self):
-        self.mt = MessageType.MIDI_2_CHANNEL_VOICE
-
     @classmethod
-    def parse(cls, words, **kwargs):
-        group = (words[0] >> 24) & 0xF
-        status = cls.Status((words[0] >> 20) & 0xF)
-        channel = (words[0] >> 16) & 0xF
-        return MIDI2_BY_STATUS[status].parse(
-            words,
-            group=group,
-            channel=channel,
-            **kwargs,
-        )
+    def parse(cls, words):
+        status = (words[0] >> 20) & 0xF
+        if (impl := _MIDI2_BY_STATUS[status]) is None:
+            raise ValueError(f"Unsupported MIDI 2.0 Channel Voice status {status:#x}")
+        return impl.parse(words)
 
     def encode_into(self, words: list[int]) -> None:
-        super().encode_into(words)
-        words[0] |= (self.group << 24) | (self.status << 20) | (self.channel << 16)
+        words[0] |= self._header | (self.group << 24) | (self.channel << 16)
 
 
-@dataclass
+@dataclass(slots=True)
 class MIDI2NoteOff(MIDI2ChannelVoice):
+    status = MIDI2ChannelVoice.Status.NOTE_OFF
+
     note: int
     attribute_type: int
     velocity: int
     attribute_data: int
 
-    def __post_init__(self):
-        super().__post_init__()
-        self.status = MIDI2ChannelVoice.Status.NOTE_OFF
-
     @classmethod
-    def parse(cls, words, **kwargs):
+    def parse(cls, words):
         return cls(
+            group=(words[0] >> 24) & 0xF,
+            channel=(words[0] >> 16) & 0xF,
             note=(words[0] >> 8) & 0x7F,
             attribute_type=words[0] & 0xFF,
             velocity=words[1] >> 16,
             attribute_data=words[1] & 0xFFFF,
-            **kwargs,
         )
 
     def encode_into(self, words: list[int]) -> None:
-        super().encode_into(words)
+        MIDI2ChannelVoice.encode_into(self, words)
         words[0] |= (self.note << 8) | self.attribute_type
         words[1] |= (self.velocity << 16) | self.attribute_data
 
 
-@dataclass
+@dataclass(slots=True)
 class MIDI2NoteOn(MIDI2ChannelVoice):
+    status = MIDI2ChannelVoice.Status.NOTE_ON
+
     note: int
     attribute_type: int
     velocity: int
     attribute_data: int
 
-    def __post_init__(self):
-        super().__post_init__()
-        self.status = MIDI2ChannelVoice.Status.NOTE_ON
-
     @classmethod
-    def parse(cls, words, **kwargs):
+    def parse(cls, words):
         return cls(
+            group=(words[0] >> 24) & 0xF,
+            channel=(words[0] >> 16) & 0xF,
             note=(words[0] >> 8) & 0x7F,
             attribute_type=words[0] & 0xFF,
             velocity=words[1] >> 16,
             attribute_data=words[1] & 0xFFFF,
-            **kwargs,
         )
 
     def encode_into(self, words: list[int]) -> None:
-        super().encode_into(words)
+        MIDI2ChannelVoice.encode_into(self, words)
         words[0] |= (self.note << 8) | self.attribute_type
         words[1] |= (self.velocity << 16) | self.attribute_data
 
 
-@dataclass
+@dataclass(slots=True)
 class MIDI2ControlChange(MIDI2ChannelVoice):
+    status = MIDI2ChannelVoice.Status.CONTROL_CHANGE
+
     controller: int
     data: int
 
-    def __post_init__(self):
-        super().__post_init__()
-        self.status = MIDI2ChannelVoice.Status.CONTROL_CHANGE
-
     @classmethod
-    def parse(cls, words, **kwargs):
+    def parse(cls, words):
         return cls(
+            group=(words[0] >> 24) & 0xF,
+            channel=(words[0] >> 16) & 0xF,
             controller=(words[0] >> 8) & 0x7F,
             data=words[1],
-            **kwargs,
         )
 
     def encode_into(self, words: list[int]) -> None:
-        super().encode_into(words)
+        MIDI2ChannelVoice.encode_into(self, words)
         words[0] |= self.controller << 8
         words[1] |= self.data
 
 
-@dataclass
+@dataclass(slots=True)
 class MIDI2ProgramChange(MIDI2ChannelVoice):
+    status = MIDI2ChannelVoice.Status.PROGRAM_CHANGE
+
     program: int
     bank_valid: bool
     bank: int
 
-    def __post_init__(self):
-        super().__post_init__()
-        self.status = MIDI2ChannelVoice.Status.PROGRAM_CHANGE
-
     @classmethod
-    def parse(cls, words, **kwargs):
+    def parse(cls, words):
         bank_msb = (words[1] >> 8) & 0x7F
         bank_lsb = words[1] & 0x7F
         return cls(
-            bank_valid=bool(words[0] & (1 << 0)),
+            group=(words[0] >> 24) & 0xF,
+            channel=(words[0] >> 16) & 0xF,
+            bank_valid=_BOOL[words[0] & 1],
             program=(words[1] >> 24) & 0x7F,
             bank=(bank_msb << 7) | bank_lsb,
-            **kwargs,
         )
 
     def encode_into(self, words: list[int]) -> None:
-        super().encode_into(words)
+        MIDI2ChannelVoice.encode_into(self, words)
         bank_lsb = self.bank & 0x7F
         bank_msb = self.bank >> 7
-        print(hex(self.bank), hex(bank_msb), hex(bank_lsb))
         words[0] |= self.bank_valid
         words[1] |= (self.program << 24) | (bank_msb << 8) | bank_lsb
 
 
-@dataclass
+@dataclass(slots=True)
 class MIDI2PitchBend(MIDI2ChannelVoice):
-    value: int
+    status = MIDI2ChannelVoice.Status.PITCH_BEND
 
-    def __post_init__(self):
-        super().__post_init__()
-        self.status = MIDI2ChannelVoice.Status.PITCH_BEND
+    value: int
 
     @classmethod
-    def parse(cls, words, **kwargs):
-        return cls(value=words[1], **kwargs)
+    def parse(cls, words):
+        return cls(
+            group=(words[0] >> 24) & 0xF,
+            channel=(words[0] >> 16) & 0xF,
+            value=words[1],
+        )
 
     def encode_into(self, words: list[int]) -> None:
-        super().encode_into(words)
+        MIDI2ChannelVoice.encode_into(self, words)
         words[1] |= self.value
 
 
 # Data Messages (64-bit and 128-bit)
-@dataclass
+@dataclass(slots=True)
 class Data64(UMP):
+    mt = MessageType.DATA_64
+
     group: int
     status: StreamFormat
     data: list[int]  # up to 6 bytes
 
-    def __post_init__(self):
-        self.mt = MessageType.DATA_64
-
     @classmethod
-    def parse(cls, words, **kwargs):
+    def parse(cls, words):
         length = (words[0] >> 16) & 0xF
-        data = [
-            *(words[0] & 0x7F7F).to_bytes(length=2, byteorder="big"),
-            *(words[1] & 0x7F7F7F7F).to_bytes(length=4, byteorder="big"),
-        ]
+        data = struct.pack(">HI", words[0] & 0x7F7F, words[1] & 0x7F7F7F7F)
         return cls(
             group=(words[0] >> 24) & 0xF,
             status=StreamFormat((words[0] >> 20) & 0xF),
-            data=data[:length],
-            **kwargs,
+            data=list(data[:length]),
         )
 
     def encode_into(self, words: list[int]) -> None:
         if len(self.data) > 6:
             raise ValueError("Data64 message can only carry up to 6 bytes of data")
-        super().encode_into(words)
-        data = list(self.data)
-        if len(data) < 6:
-            data += (6 - len(data)) * [0]
+        UMP.encode_into(self, words)
+        data = bytes(self.data).ljust(6, b"\x00")
+        # System exclusive data bytes only carry 7 bits
+        first, rest = struct.unpack(">HI", data)
         words[0] |= (
             (self.group << 24)
             | (self.status << 20)
             | (len(self.data) << 16)
-            | ((data[0] & 0x7F) << 8)
-            | (data[1] & 0x7F)
+            | (first & 0x7F7F)
         )
-        words[1] = int.from_bytes(data[2:], byteorder="big")
+        words[1] = rest & 0x7F7F7F7F
 
 
-@dataclass
+@dataclass(slots=True)
 class Data128(UMP):
+    mt = MessageType.DATA_128
+
     group: int
     status: StreamFormat
     stream_id: int
     data: list[int]  # up to 13 bytes
 
-    def __post_init__(self):
-        self.mt = MessageType.DATA_128
-
     @classmethod
-    def parse(cls, words, **kwargs):
+    def parse(cls, words):
         length = (words[0] >> 16) & 0xF
-        data = [
-            words[0] & 0xFF,
-            *words[1].to_bytes(length=4, byteorder="big"),
-            *words[2].to_bytes(length=4, byteorder="big"),
-            *words[3].to_bytes(length=4, byteorder="big"),
-        ]
+        data = struct.pack(">B3I", words[0] & 0xFF, words[1], words[2], words[3])
         return cls(
             group=(words[0] >> 24) & 0xF,
             status=StreamFormat((words[0] >> 20) & 0xF),
             stream_id=(words[0] >> 8) & 0xFF,
-            data=data[:length],
-            **kwargs,
+            data=list(data[:length]),
         )
 
     def encode_into(self, words: list[int]) -> None:
         if len(self.data) > 13:
             raise ValueError("Data64 message can only carry up to 13 bytes of data")
-        super().encode_into(words)
-        data = list(self.data)
-        if len(data) < 13:
-            data += (13 - len(data)) * [0]
+        UMP.encode_into(self, words)
+        data = bytes(self.data).ljust(13, b"\x00")
+        first, words[1], words[2], words[3] = struct.unpack(">B3I", data)
         words[0] |= (
             (self.group << 24)
             | (self.status << 20)
             | (len(self.data) << 16)
             | (self.stream_id << 8)
-            | (data[0] & 0xFF)
+            | first
         )
-        words[1] = int.from_bytes(data[1:5], byteorder="big")
-        words[2] = int.from_bytes(data[5:9], byteorder="big")
-        words[3] = int.from_bytes(data[9:13], byteorder="big")
 
 
 # Flex Data Messages
-@dataclass
+@dataclass(slots=True)
 class FlexData(UMP):
     class StatusBank(IntEnum):
         SETUP_AND_PERFORMANCE_EVENTS = 0x00
         METADATA_TEXT = 0x01
         PERFORMANCE_TEXT_EVENTS = 0x02
 
+    mt = MessageType.FLEX_DATA
+    status_bank: ClassVar[StatusBank]
+    _status_attr = "status_bank"
+    _status_shift = 8
+
     group: int
     form: StreamFormat
     address: int
     channel: int
-    status_bank: StatusBank = field(init=False)
-
-    def __post_init__(self):
-        self.mt = MessageType.FLEX_DATA
 
     @classmethod
-    def parse(cls, words, **kwargs):
-        status_bank = cls.StatusBank((words[0] >> 8) & 0xFF)
-        return FLEX_DATA_BY_STATUS_BANK[status_bank].parse(
+    def parse(cls, words):
+        status_bank = (words[0] >> 8) & 0xFF
+        if (impl := _FLEX_DATA_BY_STATUS_BANK[status_bank]) is None:
+            raise ValueError(f"Unsupported Flex Data status bank {status_bank:#x}")
+        return impl.parse(
             words,
-            group=(words[0] >> 24) & 0xF,
-            form=StreamFormat((words[0] >> 22) & 0x3),
-            address=(words[0] >> 16) & 0x3F,
-            channel=(words[0] >> 12) & 0xF,
-            status=words[0] & 0xFF,
-            **kwargs,
+            (words[0] >> 24) & 0xF,
+            _STREAM_FORMATS[(words[0] >> 22) & 0x3],
+            (words[0] >> 20) & 0x3,
+            (words[0] >> 16) & 0xF,
+            words[0] & 0xFF,
         )
 
     def encode_into(self, words: list[int]) -> None:
-        super().encode_into(words)
         words[0] |= (
-            (self.group << 24)
+            self._header
+            | (self.group << 24)
             | (self.form << 22)
-            | (self.address << 16)
-            | (self.channel << 12)
-            | (self.status_bank << 8)
+            | (self.address << 20)
+            | (self.channel << 16)
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class SetupAndPerformanceEvent(FlexData):
     class Status(IntEnum):
         SET_TEMPO = 0x00
@@ -678,21 +690,26 @@ class SetupAndPerformanceEvent(FlexData):
         SET_CHORD_NAME = 0x06
         TEXT_EVENT = 0x10
 
-    status: Status
+    status_bank = FlexData.StatusBank.SETUP_AND_PERFORMANCE_EVENTS
 
-    def __post_init__(self):
-        self.status_bank = FlexData.StatusBank.SETUP_AND_PERFORMANCE_EVENTS
+    status: Status
 
     @classmethod
-    def parse(cls, words, status, **kwargs):
-        return cls(status=cls.Status(status))
+    def parse(cls, words, group, form, address, channel, status):
+        return cls(
+            group=group,
+            form=form,
+            address=address,
+            channel=channel,
+            status=cls.Status(status),
+        )
 
     def encode_into(self, words: list[int]) -> None:
-        super().encode_into(words)
+        FlexData.encode_into(self, words)
         words[0] |= self.status
 
 
-@dataclass
+@dataclass(slots=True)
 class MetadataText(FlexData):
     class Status(IntEnum):
         UNKNOWN = 0x00
@@ -709,21 +726,26 @@ class MetadataText(FlexData):
         RECORDING_DATE = 0x0B
         RECORDING_LOCATION = 0x0C
 
-    status: Status
+    status_bank = FlexData.StatusBank.METADATA_TEXT
 
-    def __post_init__(self):
-        self.status_bank = FlexData.StatusBank.METADATA_TEXT
+    status: Status
 
     @classmethod
-    def parse(cls, words, status, **kwargs):
-        return cls(status=cls.Status(status))
+    def parse(cls, words, group, form, address, channel, status):
+        return cls(
+            group=group,
+            form=form,
+            address=address,
+            channel=channel,
+            status=cls.Status(status),
+        )
 
     def encode_into(self, words: list[int]) -> None:
-        super().encode_into(words)
+        FlexData.encode_into(self, words)
         words[0] |= self.status
 
 
-@dataclass
+@dataclass(slots=True)
 class PerformanceTextEvent(FlexData):
     class Status(IntEnum):
         UNKNOWN = 0x00
@@ -732,22 +754,27 @@ class PerformanceTextEvent(FlexData):
         RUBY = 0x03
         RUBY_LANGUAGE = 0x04
 
-    status: Status
+    status_bank = FlexData.StatusBank.PERFORMANCE_TEXT_EVENTS
 
-    def __post_init__(self):
-        self.status_bank = FlexData.StatusBank.PERFORMANCE_TEXT_EVENTS
+    status: Status
 
     @classmethod
-    def parse(cls, words, status, **kwargs):
-        return cls(status=cls.Status(status))
+    def parse(cls, words, group, form, address, channel, status):
+        return cls(
+            group=group,
+            form=form,
+            address=address,
+            channel=channel,
+            status=cls.Status(status),
+        )
 
     def encode_into(self, words: list[int]) -> None:
-        super().encode_into(words)
+        FlexData.encode_into(self, words)
         words[0] |= self.status
 
 
 # UMP Stream Messages (keeping your existing implementation)
-@dataclass
+@dataclass(slots=True)
 class UMPStream(UMP):
     class Status(IntEnum):
         ENDPOINT_DISCOVERY = 0x00
@@ -763,24 +790,25 @@ class UMPStream(UMP):
         START_OF_CLIP = 0x20
         END_OF_CLIP = 0x21
 
-    form: StreamFormat
-    status: Status = field(init=False)
+    mt = MessageType.UMP_STREAM
+    status: ClassVar[Status]
+    _status_shift = 16
 
-    def __post_init__(self):
-        self.mt = MessageType.UMP_STREAM
+    form: StreamFormat
 
     @classmethod
-    def parse(cls, words, **kwargs):
-        form = StreamFormat((words[0] >> 26) & 0x03)
-        status = UMPStream.Status((words[0] >> 16) & 0x3FF)
-        return UMP_STREAM_BY_STATUS[status].parse(words, form=form, **kwargs)
+    def parse(cls, words):
+        form = _STREAM_FORMATS[(words[0] >> 26) & 0x03]
+        status = (words[0] >> 16) & 0x3FF
+        if (impl := _UMP_STREAM_BY_STATUS[status]) is None:
+            raise ValueError(f"Unsupported UMP Stream status {status:#x}")
+        return impl.parse(words, form)
 
     def encode_into(self, words: list[int]) -> None:
-        super().encode_into(words)
-        words[0] |= (self.form << 26) | (self.status << 16)
+        words[0] |= self._header | (self.form << 26)
 
 
-@dataclass
+@dataclass(slots=True)
 class EndpointDiscovery(UMPStream):
     class Filter(IntFlag):
         ENDPOINT_INFO_NOTIFICATION = 1 << 0
@@ -790,29 +818,33 @@ class EndpointDiscovery(UMPStream):
         STREAM_CONFIGURATION_NOTIFICATION = 1 << 4
         ALL = 0x1F
 
+    status = UMPStream.Status.ENDPOINT_DISCOVERY
+
     ump_version: tuple[int, int]
-    filter: Filter
+    filter: int
 
-    def __post_init__(self):
-        super().__post_init__()
-        self.status = UMPStream.Status.ENDPOINT_DISCOVERY
+    @property
+    def filter_flags(self) -> Filter:
+        return self.Filter(self.filter)
 
     @classmethod
-    def parse(cls, words, **kwargs):
+    def parse(cls, words, form):
         return cls(
             ump_version=((words[0] >> 8) & 0xFF, words[0] & 0xFF),
-            filter=cls.Filter(words[1] & 0x1F),
-            **kwargs,
+            filter=words[1] & 0x1F,
+            form=form,
         )
 
     def encode_into(self, words: list[int]) -> None:
-        super().encode_into(words)
+        UMPStream.encode_into(self, words)
         words[0] |= (self.ump_version[0] << 8) | self.ump_version[1]
         words[1] |= self.filter
 
 
-@dataclass
+@dataclass(slots=True)
 class EndpointInfoNotification(UMPStream):
+    status = UMPStream.Status.ENDPOINT_INFO_NOTIFICATION
+
     ump_version: tuple[int, int]
     static: bool
     n_function_blocks: int
@@ -821,25 +853,21 @@ class EndpointInfoNotification(UMPStream):
     rxjr: bool
     txjr: bool
 
-    def __post_init__(self):
-        super().__post_init__()
-        self.status = UMPStream.Status.ENDPOINT_INFO_NOTIFICATION
-
     @classmethod
-    def parse(cls, words, **kwargs):
+    def parse(cls, words, form):
         return cls(
             ump_version=((words[0] >> 8) & 0xFF, words[0] & 0xFF),
-            static=bool(words[1] & (1 << 31)),
+            static=_BOOL[(words[1] >> 31) & 1],
             n_function_blocks=(words[1] >> 24) & 0x7F,
-            midi2=bool(words[1] & (1 << 9)),
-            midi1=bool(words[1] & (1 << 8)),
-            rxjr=bool(words[1] & (1 << 1)),
-            txjr=bool(words[1] & (1 << 0)),
-            **kwargs,
+            midi2=_BOOL[(words[1] >> 9) & 1],
+            midi1=_BOOL[(words[1] >> 8) & 1],
+            rxjr=_BOOL[(words[1] >> 1) & 1],
+            txjr=_BOOL[words[1] & 1],
+            form=form,
         )
 
     def encode_into(self, words: list[int]) -> None:
-        super().encode_into(words)
+        UMPStream.encode_into(self, words)
         words[0] |= (self.ump_version[0] << 8) | self.ump_version[1]
         words[1] |= (
             (self.static << 31)
@@ -851,23 +879,23 @@ class EndpointInfoNotification(UMPStream):
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class DeviceIdentityNotification(UMPStream):
+    status = UMPStream.Status.DEVICE_IDENTITY_NOTIFICATION
+
     device_manufacturer: tuple[int, int, int]
     device_family: int
     device_family_model: int
     software_revision: tuple[int, int, int, int]
 
     def __post_init__(self):
-        super().__post_init__()
-        self.status = UMPStream.Status.DEVICE_IDENTITY_NOTIFICATION
         if len(self.device_manufacturer) != 3:
             raise ValueError("Device manufacturer should be a triple")
         if len(self.software_revision) != 4:
             raise ValueError("Software revision should be a quadruplet")
 
     @classmethod
-    def parse(cls, words, **kwargs):
+    def parse(cls, words, form):
         family_lsb = (words[2] >> 24) & 0x7F
         family_msb = (words[2] >> 16) & 0x7F
         model_lsb = (words[2] >> 8) & 0x7F
@@ -886,161 +914,157 @@ class DeviceIdentityNotification(UMPStream):
                 (words[3] >> 8) & 0x7F,
                 words[3] & 0x7F,
             ),
-            **kwargs,
+            form=form,
         )
 
     def encode_into(self, words: list[int]) -> None:
-        super().encode_into(words)
+        UMPStream.encode_into(self, words)
         family_lsb = self.device_family & 0x7F
         family_msb = (self.device_family >> 7) & 0x7F
         model_lsb = self.device_family_model & 0x7F
         model_msb = (self.device_family_model >> 7) & 0x7F
-        words[1] |= int.from_bytes(self.device_manufacturer, byteorder="big")
-        words[2] = int.from_bytes(
-            (family_lsb, family_msb, model_lsb, model_msb),
-            byteorder="big",
+        manufacturer = self.device_manufacturer
+        revision = self.software_revision
+        # All identity bytes carry 7 bits, mask them so none spills into its neighbour
+        words[1] |= (
+            ((manufacturer[0] & 0x7F) << 16)
+            | ((manufacturer[1] & 0x7F) << 8)
+            | (manufacturer[2] & 0x7F)
+        )
+        words[2] = (
+            (family_lsb << 24) | (family_msb << 16) | (model_lsb << 8) | model_msb
+        )
+        words[3] = (
+            ((revision[0] & 0x7F) << 24)
+            | ((revision[1] & 0x7F) << 16)
+            | ((revision[2] & 0x7F) << 8)
+            | (revision[3] & 0x7F)
         )
-        words[3] = int.from_bytes(self.software_revision, byteorder="big")
 
 
-@dataclass
+@dataclass(slots=True)
 class EndpointNameNotification(UMPStream):
-    name: str
+    status = UMPStream.Status.ENDPOINT_NAME_NOTIFICATION
 
-    def __post_init__(self):
-        super().__post_init__()
-        self.status = UMPStream.Status.ENDPOINT_NAME_NOTIFICATION
+    name: str
 
     @classmethod
-    def parse(cls, words, **kwargs):
-        chars = [
-            *(words[0] & 0xFFFF).to_bytes(length=2, byteorder="big"),
-            *words[1].to_bytes(length=4, byteorder="big"),
-            *words[2].to_bytes(length=4, byteorder="big"),
-            *words[3].to_bytes(length=4, byteorder="big"),
-        ]
-        return cls(
-            name=bytes(chars).decode("utf-8").rstrip("\x00"),
-            **kwargs,
-        )
+    def parse(cls, words, form):
+        chars = struct.pack(">H3I", words[0] & 0xFFFF, words[1], words[2], words[3])
+        return cls(name=chars.decode().rstrip("\x00"), form=form)
 
     def encode_into(self, words: list[int]) -> None:
-        chars = self.name.encode("utf-8").ljust(14, b"\x00")
+        chars = self.name.encode("utf-8")
         if len(chars) > 14:
             raise ValueError("Endpoint name notification can carry up to 14 bytes")
 
-        super().encode_into(words)
-        words[0] |= int.from_bytes(chars[:2], byteorder="big")
-        words[1] = int.from_bytes(chars[2:6], byteorder="big")
-        words[2] = int.from_bytes(chars[6:10], byteorder="big")
-        words[3] = int.from_bytes(chars[10:], byteorder="big")
+        UMPStream.encode_into(self, words)
+        # Left-align the characters, the remaining bytes are NUL padding
+        payload = int.from_bytes(chars, byteorder="big") << (8 * (14 - len(chars)))
+        words[0] |= payload >> 96
+        words[1] = (payload >> 64) & 0xFFFFFFFF
+        words[2] = (payload >> 32) & 0xFFFFFFFF
+        words[3] = payload & 0xFFFFFFFF
 
 
-@dataclass
+@dataclass(slots=True)
 class ProductInstanceIdNotification(UMPStream):
-    product_instance_id: str  # up to 14 bytes
+    status = UMPStream.Status.PRODUCT_INSTANCE_ID_NOTIFICATION
 
-    def __post_init__(self):
-        super().__post_init__()
-        self.status = UMPStream.Status.PRODUCT_INSTANCE_ID_NOTIFICATION
+    product_instance_id: str  # up to 14 bytes
 
     @classmethod
-    def parse(cls, words, **kwargs):
-        chars = [
-            *(words[0] & 0xFFFF).to_bytes(length=2, byteorder="big"),
-            *words[1].to_bytes(length=4, byteorder="big"),
-            *words[2].to_bytes(length=4, byteorder="big"),
-            *words[3].to_bytes(length=4, byteorder="big"),
-        ]
+    def parse(cls, words, form):
+        chars = struct.pack(">H3I", words[0] & 0xFFFF, words[1], words[2], words[3])
         return cls(
-            product_instance_id=bytes(chars).decode("ascii").rstrip("\x00"),
-            **kwargs,
+            product_instance_id=chars.decode("ascii").rstrip("\x00"),
+            form=form,
         )
 
     def encode_into(self, words: list[int]) -> None:
-        chars = self.product_instance_id.encode("ascii").ljust(14, b"\x00")
+        chars = self.product_instance_id.encode("ascii")
         if len(chars) > 14:
             raise ValueError("Product instance id can carry up to 14 bytes")
 
-        super().encode_into(words)
-        words[0] |= int.from_bytes(chars[:2], byteorder="big")
-        words[1] = int.from_bytes(chars[2:6], byteorder="big")
-        words[2] = int.from_bytes(chars[6:10], byteorder="big")
-        words[3] = int.from_bytes(chars[10:], byteorder="big")
+        UMPStream.encode_into(self, words)
+        # Left-align the characters, the remaining bytes are NUL padding
+        payload = int.from_bytes(chars, byteorder="big") << (8 * (14 - len(chars)))
+        words[0] |= payload >> 96
+        words[1] = (payload >> 64) & 0xFFFFFFFF
+        words[2] = (payload >> 32) & 0xFFFFFFFF
+        words[3] = payload & 0xFFFFFFFF
 
 
-@dataclass
+@dataclass(slots=True)
 class StreamConfigurationRequest(UMPStream):
+    status = UMPStream.Status.STREAM_CONFIGURATION_REQUEST
+
     protocol: int
     extensions: bool
 
-    def __post_init__(self):
-        super().__post_init__()
-        self.status = UMPStream.Status.STREAM_CONFIGURATION_REQUEST
-
     @classmethod
-    def parse(cls, words, **kwargs):
+    def parse(cls, words, form):
         return cls(
             protocol=(words[0] >> 8) & 0xFF,
-            extensions=bool(words[0] & (1 << 7)),
-            **kwargs,
+            extensions=_BOOL[(words[0] >> 7) & 1],
+            form=form,
         )
 
     def encode_into(self, words: list[int]) -> None:
-        super().encode_into(words)
+        UMPStream.encode_into(self, words)
         words[0] |= (self.protocol << 8) | (self.extensions << 7)
 
 
-@dataclass
+@dataclass(slots=True)
 class StreamConfigurationNotification(UMPStream):
+    status = UMPStream.Status.STREAM_CONFIGURATION_NOTIFICATION
+
     protocol: int
     extensions: bool
 
-    def __post_init__(self):
-        super().__post_init__()
-        self.status = UMPStream.Status.STREAM_CONFIGURATION_NOTIFICATION
-
     @classmethod
-    def parse(cls, words, **kwargs):
+    def parse(cls, words, form):
         return cls(
             protocol=(words[0] >> 8) & 0xFF,
-            extensions=bool(words[0] & (1 << 7)),
-            **kwargs,
+            extensions=_BOOL[(words[0] >> 7) & 1],
+            form=form,
         )
 
     def encode_into(self, words: list[int]) -> None:
-        super().encode_into(words)
+        UMPStream.encode_into(self, words)
         words[0] |= (self.protocol << 8) | (self.extensions << 7)
 
 
-@dataclass
+@dataclass(slots=True)
 class FunctionBlockDiscovery(UMPStream):
     class Filter(IntFlag):
         FUNCTION_BLOCK_INFO = 1 << 0
         FUNCTION_BLOCK_NAME = 1 << 1
         ALL = 0x03
 
+    status = UMPStream.Status.FUNCTION_BLOCK_DISCOVERY
+
     block_num: int
-    filter: Filter
+    filter: int
 
-    def __post_init__(self):
-        super().__post_init__()
-        self.status = UMPStream.Status.FUNCTION_BLOCK_DISCOVERY
+    @property
+    def filter_flags(self) -> Filter:
+        return self.Filter(self.filter)
 
     @classmethod
-    def parse(cls, words, **kwargs):
+    def parse(cls, words, form):
         return cls(
             block_num=(words[0] >> 8) & 0xFF,
             filter=words[0] & 0xFF,
-            **kwargs,
+            form=form,
         )
 
     def encode_into(self, words: list[int]) -> None:
-        super().encode_into(words)
+        UMPStream.encode_into(self, words)
         words[0] |= (self.block_num << 8) | self.filter
 
 
-@dataclass
+@dataclass(slots=True)
 class FunctionBlockInfoNotification(UMPStream):
     class MIDI1Mode(IntEnum):
         NOT_MIDI1 = 0x00
@@ -1055,6 +1079,8 @@ class FunctionBlockInfoNotification(UMPStream):
         def is_restricted_31_25kbps(self):
             return self is self.MIDI1_RESTRICT_BANDWITH
 
+    status = UMPStream.Status.FUNCTION_BLOCK_INFO_NOTIFICATION
+
     active: bool
     function_block_id: int
     ui_hint_sender: bool
@@ -1067,29 +1093,26 @@ class FunctionBlockInfoNotification(UMPStream):
     midi_ci_version: int
     max_sysex_8_streams: int
 
-    def __post_init__(self):
-        super().__post_init__()
-        self.status = UMPStream.Status.FUNCTION_BLOCK_INFO_NOTIFICATION
-
     @classmethod
-    def parse(cls, words, **kwargs):
+    def parse(cls, words, form):
+        w0, w1 = words[0], words[1]
         return cls(
-            active=bool((words[0] >> 15) & 1),
-            function_block_id=(words[0] >> 8) & 0x7F,
-            ui_hint_sender=bool((words[0] >> 5) & 1),
-            ui_hint_receiver=bool((words[0] >> 4) & 1),
-            midi1=cls.MIDI1Mode((words[0] >> 2) & 0x03),
-            is_output=bool((words[0] >> 1) & 1),
-            is_input=bool(words[0] & 1),
-            first_group=words[1] >> 24,
-            number_of_groups=(words[1] >> 16) & 0xFF,
-            midi_ci_version=(words[1] >> 8) & 0xFF,
-            max_sysex_8_streams=words[1] & 0xFF,
-            **kwargs,
+            active=_BOOL[(w0 >> 15) & 1],
+            function_block_id=(w0 >> 8) & 0x7F,
+            ui_hint_sender=_BOOL[(w0 >> 5) & 1],
+            ui_hint_receiver=_BOOL[(w0 >> 4) & 1],
+            midi1=cls.MIDI1Mode((w0 >> 2) & 0x03),
+            is_output=_BOOL[(w0 >> 1) & 1],
+            is_input=_BOOL[w0 & 1],
+            first_group=w1 >> 24,
+            number_of_groups=(w1 >> 16) & 0xFF,
+            midi_ci_version=(w1 >> 8) & 0xFF,
+            max_sysex_8_streams=w1 & 0xFF,
+            form=form,
         )
 
     def encode_into(self, words: list[int]) -> None:
-        super().encode_into(words)
+        UMPStream.encode_into(self, words)
         words[0] |= (
             (self.active << 15)
             | (self.function_block_id << 8)
@@ -1099,147 +1122,172 @@ class FunctionBlockInfoNotification(UMPStream):
             | (self.is_output << 1)
             | self.is_input
         )
-        words[1] = int.from_bytes(
-            [
-                self.first_group,
-                self.number_of_groups,
-                self.midi_ci_version,
-                self.max_sysex_8_streams,
-            ],
-            byteorder="big",
+        words[1] = (
+            ((self.first_group & 0xFF) << 24)
+            | ((self.number_of_groups & 0xFF) << 16)
+            | ((self.midi_ci_version & 0xFF) << 8)
+            | (self.max_sysex_8_streams & 0xFF)
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class FunctionBlockNameNotification(UMPStream):
+    status = UMPStream.Status.FUNCTION_BLOCK_NAME_NOTIFICATION
+
     function_block_id: int
     name: str
 
-    def __post_init__(self):
-        super().__post_init__()
-        self.status = UMPStream.Status.FUNCTION_BLOCK_NAME_NOTIFICATION
-
     @classmethod
-    def parse(cls, words, **kwargs):
+    def parse(cls, words, form):
         function_block_id = (words[0] >> 8) & 0xFF
 
-        # Extract name from remaining bytes
-        name_bytes = []
+        # The name is in the last byte of the first word and the 3 other words
+        name_bytes = struct.pack(">B3I", words[0] & 0xFF, words[1], words[2], words[3])
 
-        # Get remaining byte from first word
-        name_bytes.append(words[0] & 0xFF)
+        # The name ends at the first null byte
+        name_bytes = name_bytes.partition(b"\x00")[0]
+        try:
+            # Strict decoding with the default codec takes CPython's fast path
+            name = name_bytes.decode()
+        except UnicodeDecodeError:
+            name = name_bytes.decode("utf-8", errors="ignore")
 
-        # Get bytes from remaining words
-        for i in range(1, 4):
-            for j in range(4):
-                byte_val = (words[i] >> (24 - j * 8)) & 0xFF
-                name_bytes.append(byte_val)
-
-        # Remove null bytes and decode
-        name_bytes = [b for b in name_bytes if b != 0]
-        name = bytes(name_bytes).decode("utf-8", errors="ignore")
-
-        return cls(function_block_id=function_block_id, name=name, **kwargs)
+        return cls(form=form, function_block_id=function_block_id, name=name)
 
     def encode_into(self, words: list[int]) -> None:
-        super().encode_into(words)
-        words[0] |= self.function_block_id << 8
-
-        name_bytes = self.name.encode("utf-8")[
-            :13
-        ]  # Max 13 bytes (1 byte used for FB ID)
+        UMPStream.encode_into(self, words)
 
-        # Pack first byte into first word
-        if len(name_bytes) > 0:
-            words[0] |= name_bytes[0]
+        # Max 13 bytes (1 byte used for FB ID)
+        name_bytes = self.name.encode("utf-8")[:13].ljust(13, b"\x00")
+        first, words[1], words[2], words[3] = struct.unpack(">B3I", name_bytes)
+        words[0] |= (self.function_block_id << 8) | first
 
-        # Pack remaining bytes
-        idx = 1
-        for i in range(1, 4):
-            for j in range(4):
-                if idx < len(name_bytes):
-                    words[i] |= name_bytes[idx] << (24 - j * 8)
-                    idx += 1
 
-
-@dataclass
+@dataclass(slots=True)
 class StartOfClip(UMPStream):
-    def __post_init__(self):
-        super().__post_init__()
-        self.status = UMPStream.Status.START_OF_CLIP
+    status = UMPStream.Status.START_OF_CLIP
 
     @classmethod
-    def parse(cls, words, **kwargs):
-        return cls(**kwargs)
+    def parse(cls, words, form):
+        return cls(form=form)
 
 
-@dataclass
+@dataclass(slots=True)
 class EndOfClip(UMPStream):
-    def __post_init__(self):
-        super().__post_init__()
-        self.status = UMPStream.Status.END_OF_CLIP
+    status = UMPStream.Status.END_OF_CLIP
 
     @classmethod
-    def parse(cls, words, **kwargs):
-        return cls(**kwargs)
-
-
-# Lookup tables
-UMP_BY_MT = {
-    MessageType.UTILITY: Utility,
-    MessageType.SYSTEM_REAL_TIME: SystemRealTime,
-    MessageType.MIDI_1_CHANNEL_VOICE: MIDI1ChannelVoice,
-    MessageType.DATA_64: Data64,
-    MessageType.MIDI_2_CHANNEL_VOICE: MIDI2ChannelVoice,
-    MessageType.DATA_128: Data128,
-    MessageType.FLEX_DATA: FlexData,
-    MessageType.UMP_STREAM: UMPStream,
-}
-
-UTILITY_BY_STATUS = {
-    Utility.Status.NOOP: NoOp,
-    Utility.Status.JR_CLOCK: JRClock,
-    Utility.Status.JR_TIMESTAMP: JRTimestamp,
-}
-
-SYSTEM_RT_BY_STATUS = {
-    SystemRealTime.Status.MIDI_TIME_CODE: MIDITimeCode,
-    SystemRealTime.Status.SONG_POSITION_POINTER: SongPositionPointer,
-}
-
-MIDI1_BY_STATUS = {
-    MIDI1ChannelVoice.Status.NOTE_OFF: MIDI1NoteOff,
-    MIDI1ChannelVoice.Status.NOTE_ON: MIDI1NoteOn,
-    MIDI1ChannelVoice.Status.CONTROL_CHANGE: MIDI1ControlChange,
-    MIDI1ChannelVoice.Status.PROGRAM_CHANGE: MIDI1ProgramChange,
-    MIDI1ChannelVoice.Status.PITCH_BEND: MIDI1PitchBend,
-}
-
-MIDI2_BY_STATUS = {
-    MIDI2ChannelVoice.Status.NOTE_OFF: MIDI2NoteOff,
-    MIDI2ChannelVoice.Status.NOTE_ON: MIDI2NoteOn,
-    MIDI2ChannelVoice.Status.CONTROL_CHANGE: MIDI2ControlChange,
-    MIDI2ChannelVoice.Status.PROGRAM_CHANGE: MIDI2ProgramChange,
-    MIDI2ChannelVoice.Status.PITCH_BEND: MIDI2PitchBend,
-}
-
-FLEX_DATA_BY_STATUS_BANK = {
-    FlexData.StatusBank.SETUP_AND_PERFORMANCE_EVENTS: SetupAndPerformanceEvent,
-    FlexData.StatusBank.METADATA_TEXT: MetadataText,
-    FlexData.StatusBank.PERFORMANCE_TEXT_EVENTS: PerformanceTextEvent,
-}
-
-UMP_STREAM_BY_STATUS = {
-    UMPStream.Status.ENDPOINT_DISCOVERY: EndpointDiscovery,
-    UMPStream.Status.ENDPOINT_INFO_NOTIFICATION: EndpointInfoNotification,
-    UMPStream.Status.DEVICE_IDENTITY_NOTIFICATION: DeviceIdentityNotification,
-    UMPStream.Status.ENDPOINT_NAME_NOTIFICATION: EndpointNameNotification,
-    UMPStream.Status.PRODUCT_INSTANCE_ID_NOTIFICATION: ProductInstanceIdNotification,
-    UMPStream.Status.STREAM_CONFIGURATION_REQUEST: StreamConfigurationRequest,
-    UMPStream.Status.STREAM_CONFIGURATION_NOTIFICATION: StreamConfigurationNotification,
-    UMPStream.Status.FUNCTION_BLOCK_DISCOVERY: FunctionBlockDiscovery,
-    UMPStream.Status.FUNCTION_BLOCK_INFO_NOTIFICATION: FunctionBlockInfoNotification,
-    UMPStream.Status.FUNCTION_BLOCK_NAME_NOTIFICATION: FunctionBlockNameNotification,
-    UMPStream.Status.START_OF_CLIP: StartOfClip,
-    UMPStream.Status.END_OF_CLIP: EndOfClip,
+    def parse(cls, words, form):
+        return cls(form=form)
+
+
+# Lookup tables. They are read-only: parsing dispatches through the flattened
+# tuples built from them below, so adding entries later would have no effect.
+UMP_BY_MT = MappingProxyType(
+    {
+        MessageType.UTILITY: Utility,
+        MessageType.SYSTEM_REAL_TIME: SystemRealTime,
+        MessageType.MIDI_1_CHANNEL_VOICE: MIDI1ChannelVoice,
+        MessageType.DATA_64: Data64,
+        MessageType.MIDI_2_CHANNEL_VOICE: MIDI2ChannelVoice,
+        MessageType.DATA_128: Data128,
+        MessageType.FLEX_DATA: FlexData,
+        MessageType.UMP_STREAM: UMPStream,
+    },
+)
+
+UTILITY_BY_STATUS = MappingProxyType(
+    {
+        Utility.Status.NOOP: NoOp,
+        Utility.Status.JR_CLOCK: JRClock,
+        Utility.Status.JR_TIMESTAMP: JRTimestamp,
+    },
+)
+
+SYSTEM_RT_BY_STATUS = MappingProxyType(
+    {
+        SystemRealTime.Status.MIDI_TIME_CODE: MIDITimeCode,
+        SystemRealTime.Status.SONG_POSITION_POINTER: SongPositionPointer,
+    },
+)
+
+MIDI1_BY_STATUS = MappingProxyType(
+    {
+        MIDI1ChannelVoice.Status.NOTE_OFF: MIDI1NoteOff,
+        MIDI1ChannelVoice.Status.NOTE_ON: MIDI1NoteOn,
+        MIDI1ChannelVoice.Status.CONTROL_CHANGE: MIDI1ControlChange,
+        MIDI1ChannelVoice.Status.PROGRAM_CHANGE: MIDI1ProgramChange,
+        MIDI1ChannelVoice.Status.PITCH_BEND: MIDI1PitchBend,
+    },
+)
+
+MIDI2_BY_STATUS = MappingProxyType(
+    {
+        MIDI2ChannelVoice.Status.NOTE_OFF: MIDI2NoteOff,
+        MIDI2ChannelVoice.Status.NOTE_ON: MIDI2NoteOn,
+        MIDI2ChannelVoice.Status.CONTROL_CHANGE: MIDI2ControlChange,
+        MIDI2ChannelVoice.Status.PROGRAM_CHANGE: MIDI2ProgramChange,
+        MIDI2ChannelVoice.Status.PITCH_BEND: MIDI2PitchBend,
+    },
+)
+
+FLEX_DATA_BY_STATUS_BANK = MappingProxyType(
+    {
+        FlexData.StatusBank.SETUP_AND_PERFORMANCE_EVENTS: SetupAndPerformanceEvent,
+        FlexData.StatusBank.METADATA_TEXT: MetadataText,
+        FlexData.StatusBank.PERFORMANCE_TEXT_EVENTS: PerformanceTextEvent,
+    },
+)
+
+UMP_STREAM_BY_STATUS = MappingProxyType(
+    {
+        UMPStream.Status.ENDPOINT_DISCOVERY: EndpointDiscovery,
+        UMPStream.Status.ENDPOINT_INFO_NOTIFICATION: EndpointInfoNotification,
+        UMPStream.Status.DEVICE_IDENTITY_NOTIFICATION: DeviceIdentityNotification,
+        UMPStream.Status.ENDPOINT_NAME_NOTIFICATION: EndpointNameNotification,
+        UMPStream.Status.PRODUCT_INSTANCE_ID_NOTIFICATION: (
+            ProductInstanceIdNotification
+        ),
+        UMPStream.Status.STREAM_CONFIGURATION_REQUEST: StreamConfigurationRequest,
+        UMPStream.Status.STREAM_CONFIGURATION_NOTIFICATION: (
+            StreamConfigurationNotification
+        ),
+        UMPStream.Status.FUNCTION_BLOCK_DISCOVERY: FunctionBlockDiscovery,
+        UMPStream.Status.FUNCTION_BLOCK_INFO_NOTIFICATION: (
+            FunctionBlockInfoNotification
+        ),
+        UMPStream.Status.FUNCTION_BLOCK_NAME_NOTIFICATION: (
+            FunctionBlockNameNotification
+        ),
+        UMPStream.Status.START_OF_CLIP: StartOfClip,
+        UMPStream.Status.END_OF_CLIP: EndOfClip,
+    },
+)
+
+
+def _dispatch_table(by_status: Mapping, size: int) -> tuple[type[UMP] | None, ...]:
+    """Flatten a status lookup table into a tuple indexed by the raw status"""
+    return tuple(by_status.get(status) for status in range(size))
+
+
+_UMP_BY_MT = _dispatch_table(UMP_BY_MT, 1 << 4)
+_UTILITY_BY_STATUS = _dispatch_table(UTILITY_BY_STATUS, 1 << 4)
+_SYSTEM_RT_BY_STATUS = _dispatch_table(SYSTEM_RT_BY_STATUS, 1 << 8)
+_MIDI1_BY_STATUS = _dispatch_table(MIDI1_BY_STATUS, 1 << 4)
+_MIDI2_BY_STATUS = _dispatch_table(MIDI2_BY_STATUS, 1 << 4)
+_FLEX_DATA_BY_STATUS_BANK = _dispatch_table(FLEX_DATA_BY_STATUS_BANK, 1 << 8)
+_UMP_STREAM_BY_STATUS = _dispatch_table(UMP_STREAM_BY_STATUS, 1 << 10)
+
+# UMP.parse looks up the message type and the nibble following the group at
+# once. For the families whose status is that nibble, this resolves to the
+# message class directly; otherwise the family parse() dispatches further.
+_STATUS_NIBBLE_BY_MT: dict[int, Mapping] = {
+    MessageType.UTILITY: UTILITY_BY_STATUS,
+    MessageType.MIDI_1_CHANNEL_VOICE: MIDI1_BY_STATUS,
+    MessageType.MIDI_2_CHANNEL_VOICE: MIDI2_BY_STATUS,
 }
+_UMP_BY_MT_NIBBLE = tuple(
+    _STATUS_NIBBLE_BY_MT.get(mt, {}).get(nibble, _UMP_BY_MT[mt])
+    for mt in range(1 << 4)
+    for nibble in range(1 << 4)
+)
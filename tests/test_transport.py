@@ -0,0 +1,42 @@
+import sys
+from types import ModuleType
+from unittest import mock
+
+import pymidi2.ump as ump
+from pymidi2 import udp
+
+# Importing the transport module starts a zeroconf service browser: replace
+# zeroconf so that these tests neither need it installed nor touch the network
+zeroconf = ModuleType("zeroconf")
+zeroconf.ServiceBrowser = mock.Mock()  # type: ignore[attr-defined]
+zeroconf.ServiceListener = object  # type: ignore[attr-defined]
+zeroconf.Zeroconf = mock.Mock()  # type: ignore[attr-defined]
+with mock.patch.dict(sys.modules, {"zeroconf": zeroconf}):
+    from pymidi2 import transport
+
+
+def test_encode_network_ump():
+    """Test that UMP words are sent in big endian over the network."""
+    packet = ump.MIDI1NoteOn(group=2, channel=4, note=64, velocity=127)
+    assert transport._encode_network_ump(packet) == b"\x22\x94\x40\x7f"
+
+
+def test_udp_dispatch_ump_data():
+    """Test that a received UMP_DATA command is decoded into the rx queue."""
+    t = transport.UDPTransport(peer_ip="127.0.0.1", peer_port=5673)
+    t.dispatch(
+        udp.CommandPacket(
+            command=udp.CommandCode.UMP_DATA,
+            payload=b"\x42\x94\x40\x03\x09\xc4\x12\x34",
+        ),
+    )
+    assert t.rx_queue == [
+        ump.MIDI2NoteOn(
+            group=2,
+            channel=4,
+            note=64,
+            velocity=2500,
+            attribute_type=3,
+            attribute_data=0x1234,
+        ),
+    ]
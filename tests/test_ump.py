@@ -1,3 +1,5 @@
+from dataclasses import dataclass
+
 import pytest
 
 import pymidi2.ump as ump
@@ -123,6 +125,29 @@ TEST_PACKETS = [
         ),
         id="data128",
     ),
+    # Flex Data Messages
+    pytest.param(
+        [0xD2010000, 0x00000000, 0x00000000, 0x00000000],
+        ump.SetupAndPerformanceEvent(
+            group=2,
+            form=ump.StreamFormat.COMPLETE,
+            address=0,
+            channel=1,
+            status=ump.SetupAndPerformanceEvent.Status.SET_TEMPO,
+        ),
+        id="flex-data-set-tempo",
+    ),
+    pytest.param(
+        [0xD31D0103, 0x00000000, 0x00000000, 0x00000000],
+        ump.MetadataText(
+            group=3,
+            form=ump.StreamFormat.COMPLETE,
+            address=1,
+            channel=13,
+            status=ump.MetadataText.Status.MIDI_CLIP_NAME,
+        ),
+        id="flex-data-metadata-text",
+    ),
     # UMP Stream Messages
     pytest.param(
         [0xF0000101, 0x0000001C, 0x00000000, 0x00000000],
@@ -249,3 +274,182 @@ def test_ump_parse_and_encode(words, packet):
     decoded = ump.UMP.parse(words)
     assert decoded == packet
     assert packet.encode() == words
+
+
+def test_encode_many():
+    """Test that a sequence of packets is encoded into a flat list of words."""
+    words = [param.values[0] for param in TEST_PACKETS]
+    packets = [param.values[1] for param in TEST_PACKETS]
+    assert ump.encode_many(packets) == [w for ws in words for w in ws]
+
+
+@pytest.mark.parametrize(
+    "form,is_starting,is_ending",
+    [
+        (ump.StreamFormat.COMPLETE, True, True),
+        (ump.StreamFormat.START, True, False),
+        (ump.StreamFormat.CONTINUE, False, False),
+        (ump.StreamFormat.END, False, True),
+    ],
+)
+def test_stream_format_boundaries(form, is_starting, is_ending):
+    """Test the start/end flags of each stream format."""
+    assert form.is_starting == is_starting
+    assert form.is_ending == is_ending
+
+
+@pytest.mark.parametrize(
+    "words",
+    [
+        pytest.param([0x60000000], id="reserved-message-type"),
+        pytest.param([0x22A4407F], id="midi1-poly-pressure"),
+        pytest.param([0x10F80000], id="rt-timing-clock"),
+        pytest.param([0xF0FF0000, 0x00000000, 0x00000000, 0x00000000], id="stream"),
+    ],
+)
+def test_ump_parse_unsupported(words):
+    """Test that parsing a message without implementation raises ValueError."""
+    with pytest.raises(ValueError):
+        ump.UMP.parse(words)
+
+
+def test_parse_many():
+    """Test that a flat list of words is parsed into consecutive packets."""
+    words = [param.values[0] for param in TEST_PACKETS]
+    packets = [param.values[1] for param in TEST_PACKETS]
+    assert ump.parse_many([w for ws in words for w in ws]) == packets
+
+
+def test_parse_many_truncated():
+    """Test that a packet cut short at the end of the words is rejected."""
+    with pytest.raises(ValueError):
+        ump.parse_many([0x2294407F, 0x42944003])
+
+
+def test_function_block_name_invalid_utf8():
+    """Test that invalid UTF-8 bytes in a function block name are dropped."""
+    packet = ump.UMP.parse([0xF0120148, 0x69FF0000, 0x00000000, 0x00000000])
+    assert packet.name == "Hi"
+
+
+@pytest.mark.parametrize("words,packet", TEST_PACKETS)
+def test_encode_is_silent(words, packet, capsys):
+    """Test that encoding a packet does not write anything to stdout."""
+    packet.encode()
+    assert capsys.readouterr().out == ""
+
+
+@pytest.mark.parametrize(
+    "table",
+    [
+        ump.UMP_BY_MT,
+        ump.UTILITY_BY_STATUS,
+        ump.SYSTEM_RT_BY_STATUS,
+        ump.MIDI1_BY_STATUS,
+        ump.MIDI2_BY_STATUS,
+        ump.FLEX_DATA_BY_STATUS_BANK,
+        ump.UMP_STREAM_BY_STATUS,
+    ],
+)
+def test_lookup_tables_are_read_only(table):
+    """Test that the dispatch lookup tables cannot be extended after import."""
+    with pytest.raises(TypeError):
+        table[0xA] = ump.MIDI1NoteOn
+
+
+def test_data64_encode_masks_to_7_bits():
+    """Test that every Data64 payload byte is masked to 7 bits when encoding."""
+    packet = ump.Data64(group=0, status=ump.StreamFormat.COMPLETE, data=[0xFF] * 6)
+    assert packet.encode() == [0x30067F7F, 0x7F7F7F7F]
+
+
+@pytest.mark.parametrize(
+    "words,packet",
+    [
+        pytest.param(
+            [0xF0000101, 0x0000001F, 0x00000000, 0x00000000],
+            ump.EndpointDiscovery(
+                form=ump.StreamFormat.COMPLETE,
+                ump_version=(1, 1),
+                filter=ump.EndpointDiscovery.Filter.ALL,
+            ),
+            id="endpoint-discovery",
+        ),
+        pytest.param(
+            [0xF010FF03, 0x00000000, 0x00000000, 0x00000000],
+            ump.FunctionBlockDiscovery(
+                form=ump.StreamFormat.COMPLETE,
+                block_num=0xFF,
+                filter=ump.FunctionBlockDiscovery.Filter.ALL,
+            ),
+            id="function-block-discovery",
+        ),
+    ],
+)
+def test_discovery_filter_flags(words, packet):
+    """Test that discovery filters encode from and parse into Filter flags."""
+    assert packet.encode() == words
+    parsed = ump.UMP.parse(words)
+    assert parsed.filter_flags == type(packet).Filter.ALL
+    assert isinstance(parsed.filter_flags, type(packet).Filter)
+
+
+def test_device_identity_encode_masks_to_7_bits():
+    """Test that out of range identity bytes do not spill into other bytes."""
+    packet = ump.DeviceIdentityNotification(
+        form=ump.StreamFormat.COMPLETE,
+        device_manufacturer=(0, 0xFF, 0),
+        device_family=1,
+        device_family_model=2,
+        software_revision=(0x100, 0, 0, 0x81),
+    )
+    assert packet.encode() == [0xF0020000, 0x00007F00, 0x01000200, 0x00000001]
+
+
+def test_function_block_info_encode_masks_to_8_bits():
+    """Test that out of range group fields do not spill into other bytes."""
+    packet = ump.FunctionBlockInfoNotification(
+        form=ump.StreamFormat.COMPLETE,
+        active=True,
+        function_block_id=1,
+        ui_hint_sender=True,
+        ui_hint_receiver=True,
+        midi1=ump.FunctionBlockInfoNotification.MIDI1Mode.MIDI1_RESTRICT_BANDWITH,
+        is_input=True,
+        is_output=True,
+        first_group=0x101,
+        number_of_groups=2,
+        midi_ci_version=0x100,
+        max_sysex_8_streams=0x104,
+    )
+    assert packet.encode() == [0xF011813B, 0x01020004, 0x00000000, 0x00000000]
+
+
+def test_flex_data_parse_header_fields():
+    """Test that Flex Data header fields are not read from the status bank."""
+    packet = ump.UMP.parse([0xD0E20201, 0x00000000, 0x00000000, 0x00000000])
+    assert isinstance(packet, ump.PerformanceTextEvent)
+    assert packet.form == ump.StreamFormat.END
+    assert packet.address == 2
+    assert packet.channel == 2
+    assert packet.status == ump.PerformanceTextEvent.Status.LYRICS
+
+
+def test_function_block_name_ends_at_first_nul():
+    """Test that bytes after an embedded NUL are not part of the name."""
+    packet = ump.UMP.parse([0xF0120148, 0x69004142, 0x00000000, 0x00000000])
+    assert packet.name == "Hi"
+
+
+def test_intermediate_subclass_without_status():
+    """Test that a family subclass without a status can still be defined."""
+
+    @dataclass(slots=True)
+    class CustomChannelVoice(ump.MIDI1ChannelVoice):
+        pass
+
+    @dataclass(slots=True)
+    class CustomNoteOn(CustomChannelVoice):
+        status = ump.MIDI1ChannelVoice.Status.NOTE_ON
+
+    assert CustomNoteOn._header == ump.MIDI1NoteOn._header